@@ -9,18 +9,27 @@ Author: SIVAA Research
 Based on: Sri Yantra mathematical analysis (Huet, 2002)
 """
 
+import math
 import numpy as np
 import json
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 from typing import List, Tuple, Dict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # =============================================================================
 # CONSTANTS - SRI YANTRA MATHEMATICAL SPECIFICATIONS
 # =============================================================================
 
 # Golden Ratio
-PHI = (1 + np.sqrt(5)) / 2  # 1.6180339887...
-SQRT_PHI = np.sqrt(PHI)      # 1.2720196495...
+PHI = (1 + math.sqrt(5)) / 2  # 1.6180339887...
+SQRT_PHI = math.sqrt(PHI)    # 1.2720196495...
 
 # Sri Yantra Y-coordinates (normalized to unit circle)
 # These are from peer-reviewed mathematical analysis
@@ -76,6 +85,16 @@ class RadialChannel:
     width_mm: float
     channel_type: str  # 'thermal', 'power', 'signal'
 
+
+def _freeze(obj):
+    """Read-only copy of nested dicts/lists: MappingProxyType and tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
 # =============================================================================
 # YANTRA CHIP LAYOUT CLASS
 # =============================================================================
@@ -109,6 +128,49 @@ class YantraChipLayout:
         self.marma_sthanas = self._generate_marma_sthanas()
         self.radial_channels = self._generate_radial_channels()
         
+        # Layer areas keyed by name (layers are immutable after construction)
+        self._area_by_name = {
+            l.name: math.pi * (l.outer_radius_mm**2 - l.inner_radius_mm**2)
+            for l in self.layers
+        }
+        
+        # Layers are generated in increasing radius with the ESD boundary last,
+        # so the active core ends at the second-to-last layer
+        self._core_area_mm2 = (
+            math.pi * self.layers[-2].outer_radius_mm**2 if len(self.layers) >= 2 else 0.0)
+        
+        # Structure-of-arrays views of the layout for vectorized exporters
+        self.layer_inner_mm = np.fromiter(
+            (l.inner_radius_mm for l in self.layers), dtype=np.float64, count=len(self.layers))
+        self.layer_outer_mm = np.fromiter(
+            (l.outer_radius_mm for l in self.layers), dtype=np.float64, count=len(self.layers))
+        self.ms_x_mm = np.fromiter(
+            (ms.x_mm for ms in self.marma_sthanas), dtype=np.float64, count=len(self.marma_sthanas))
+        self.ms_y_mm = np.fromiter(
+            (ms.y_mm for ms in self.marma_sthanas), dtype=np.float64, count=len(self.marma_sthanas))
+        self.ch_angle_deg = np.fromiter(
+            (c.angle_deg for c in self.radial_channels), dtype=np.float64, count=len(self.radial_channels))
+        self.ch_start_r_mm = np.fromiter(
+            (c.start_radius_mm for c in self.radial_channels), dtype=np.float64, count=len(self.radial_channels))
+        self.ch_end_r_mm = np.fromiter(
+            (c.end_radius_mm for c in self.radial_channels), dtype=np.float64, count=len(self.radial_channels))
+        self.ch_width_mm = np.fromiter(
+            (c.width_mm for c in self.radial_channels), dtype=np.float64, count=len(self.radial_channels))
+        
+        # Micron versions of the above, converted in one multiply per field
+        self.center_um = (self.center[0] * 1000, self.center[1] * 1000)
+        self.layer_inner_um = self.layer_inner_mm * 1000.0
+        self.layer_outer_um = self.layer_outer_mm * 1000.0
+        self.ms_x_um = self.ms_x_mm * 1000.0
+        self.ms_y_um = self.ms_y_mm * 1000.0
+        self.ch_start_r_um = self.ch_start_r_mm * 1000.0
+        self.ch_end_r_um = self.ch_end_r_mm * 1000.0
+        self.ch_width_um = self.ch_width_mm * 1000.0
+        
+        # Channel direction cosines, computed once for all exporters
+        self._ch_cos = np.cos(np.radians(self.ch_angle_deg))
+        self._ch_sin = np.sin(np.radians(self.ch_angle_deg))
+        
     def _generate_layers(self) -> List[ChipLayer]:
         """Generate chip layers based on Sri Yantra radii."""
         
@@ -146,47 +208,31 @@ class YantraChipLayout:
         """
         marma_points = []
         
-        # Inner ring (6 points) - L1/L2 cache boundary
-        for i in range(6):
-            angle = i * 60 + 30  # Offset by 30 degrees
-            r = 0.22 * self.die_radius  # Between YL and YA
-            x = self.center[0] + r * np.cos(np.radians(angle))
-            y = self.center[1] + r * np.sin(np.radians(angle))
-            marma_points.append(MarmaSthana(
-                id=i+1,
-                x_mm=x,
-                y_mm=y,
-                connected_layers=['l1_cache', 'l2_cache'],
-                routing_priority=1
-            ))
-        
-        # Middle ring (6 points) - Memory controller region
-        for i in range(6):
-            angle = i * 60  # No offset
-            r = 0.53 * self.die_radius  # YP to YM region
-            x = self.center[0] + r * np.cos(np.radians(angle))
-            y = self.center[1] + r * np.sin(np.radians(angle))
-            marma_points.append(MarmaSthana(
-                id=i+7,
-                x_mm=x,
-                y_mm=y,
-                connected_layers=['l3_cache', 'memory_ctrl', 'hbm_interface'],
-                routing_priority=2
-            ))
+        # (first id, angle offset deg, radius fraction, connected layers, priority)
+        ring_specs = [
+            # Inner ring (6 points) - L1/L2 cache boundary, between YL and YA
+            (1,  30, 0.22, ['l1_cache', 'l2_cache'], 1),
+            # Middle ring (6 points) - Memory controller region, YP to YM
+            (7,   0, 0.53, ['l3_cache', 'memory_ctrl', 'hbm_interface'], 2),
+            # Outer ring (6 points) - I/O region, YG
+            (13, 30, 0.72, ['io_ring', 'pdn_ring'], 3),
+        ]
         
-        # Outer ring (6 points) - I/O region
-        for i in range(6):
-            angle = i * 60 + 30  # Offset by 30 degrees
-            r = 0.72 * self.die_radius  # YG region
-            x = self.center[0] + r * np.cos(np.radians(angle))
-            y = self.center[1] + r * np.sin(np.radians(angle))
-            marma_points.append(MarmaSthana(
-                id=i+13,
-                x_mm=x,
-                y_mm=y,
-                connected_layers=['io_ring', 'pdn_ring'],
-                routing_priority=3
-            ))
+        for first_id, offset, r_frac, connected, priority in ring_specs:
+            angles = np.radians(np.arange(6) * 60 + offset)
+            r = r_frac * self.die_radius
+            xs = self.center[0] + r * np.cos(angles)
+            ys = self.center[1] + r * np.sin(angles)
+            marma_points.extend(
+                MarmaSthana(
+                    id=first_id + i,
+                    x_mm=float(x),
+                    y_mm=float(y),
+                    connected_layers=list(connected),
+                    routing_priority=priority
+                )
+                for i, (x, y) in enumerate(zip(xs, ys))
+            )
         
         return marma_points
     
@@ -200,59 +246,56 @@ class YantraChipLayout:
         """
         channels = []
         
-        # 8 primary power delivery channels (inner lotus)
-        for i in range(8):
-            angle = i * 45
-            channels.append(RadialChannel(
-                angle_deg=angle,
-                start_radius_mm=0.1 * self.die_radius,
-                end_radius_mm=0.6 * self.die_radius,
-                width_mm=0.3,
-                channel_type='power'
-            ))
-        
-        # 16 thermal dissipation channels (outer lotus)
-        for i in range(16):
-            angle = i * 22.5
-            channels.append(RadialChannel(
-                angle_deg=angle,
-                start_radius_mm=0.5 * self.die_radius,
-                end_radius_mm=0.95 * self.die_radius,
-                width_mm=0.2,
-                channel_type='thermal'
-            ))
+        # (count, angle step deg, angle offset deg, start r, end r, width mm, type)
+        # Whole-degree steps stay int, so the exported angles keep their
+        # original 0, 45, 90 ... form
+        channel_specs = [
+            # 8 primary power delivery channels (inner lotus)
+            (8,  45,   0,    0.1, 0.6,  0.3,  'power'),
+            # 16 thermal dissipation channels (outer lotus)
+            (16, 22.5, 0,    0.5, 0.95, 0.2,  'thermal'),
+            # 8 high-speed signal channels (alternating with power)
+            (8,  45,   22.5, 0.2, 0.8,  0.15, 'signal'),
+        ]
         
-        # 8 high-speed signal channels (alternating with power)
-        for i in range(8):
-            angle = i * 45 + 22.5  # Offset from power channels
-            channels.append(RadialChannel(
-                angle_deg=angle,
-                start_radius_mm=0.2 * self.die_radius,
-                end_radius_mm=0.8 * self.die_radius,
-                width_mm=0.15,
-                channel_type='signal'
-            ))
+        for count, step, offset, r_start, r_end, width, ch_type in channel_specs:
+            angles = np.arange(count) * step + offset
+            start_r = r_start * self.die_radius
+            end_r = r_end * self.die_radius
+            channels.extend(
+                RadialChannel(
+                    angle_deg=angle,
+                    start_radius_mm=start_r,
+                    end_radius_mm=end_r,
+                    width_mm=width,
+                    channel_type=ch_type
+                )
+                for angle in angles.tolist()
+            )
         
         return channels
     
     def get_layer_area_mm2(self, layer_name: str) -> float:
         """Calculate area of a specific layer in mm²."""
-        for layer in self.layers:
-            if layer.name == layer_name:
-                return np.pi * (layer.outer_radius_mm**2 - layer.inner_radius_mm**2)
-        return 0.0
+        return self._area_by_name.get(layer_name, 0.0)
     
     def get_total_core_area_mm2(self) -> float:
         """Calculate total active area (excluding ESD boundary)."""
-        inner_layers = [l for l in self.layers if l.name != 'esd_boundary']
-        if inner_layers:
-            max_radius = max(l.outer_radius_mm for l in inner_layers)
-            return np.pi * max_radius**2
-        return 0.0
+        return self._core_area_mm2
     
     def export_gds_coordinates(self) -> Dict:
+        """Export all coordinates in GDS-compatible format (see gds_coordinates)."""
+        return self.gds_coordinates
+    
+    @cached_property
+    def gds_coordinates(self) -> Dict:
         """
-        Export all coordinates in GDS-compatible format.
+        All coordinates in GDS-compatible format, as read-only data.
+        
+        Computed once per layout; the layout has no mutators, so the
+        result stays valid for the lifetime of the instance. Mappings are
+        MappingProxyType and sequences are tuples, so a caller cannot
+        change the shared result (serialize with default=dict).
         
         Returns dict with:
         - layers: List of layer boundaries (circles)
@@ -265,7 +308,7 @@ class YantraChipLayout:
                 'size_mm': self.die_size,
                 'size_um': self.die_size * 1000,
                 'center_mm': self.center,
-                'center_um': (self.center[0] * 1000, self.center[1] * 1000),
+                'center_um': self.center_um,
                 'process_node_nm': self.process_node,
             },
             'layers': [],
@@ -278,12 +321,13 @@ class YantraChipLayout:
         }
         
         # Export layers
-        for layer in self.layers:
+        for layer, r_inner_um, r_outer_um in zip(
+                self.layers, self.layer_inner_um.tolist(), self.layer_outer_um.tolist()):
             gds_data['layers'].append({
                 'name': layer.name,
-                'inner_radius_um': layer.inner_radius_mm * 1000,
-                'outer_radius_um': layer.outer_radius_mm * 1000,
-                'center_um': (self.center[0] * 1000, self.center[1] * 1000),
+                'inner_radius_um': r_inner_um,
+                'outer_radius_um': r_outer_um,
+                'center_um': self.center_um,
                 'area_mm2': self.get_layer_area_mm2(layer.name),
                 'function': layer.function,
                 'metal_layer': layer.metal_layer,
@@ -291,44 +335,54 @@ class YantraChipLayout:
             })
         
         # Export Marma Sthanas
-        for ms in self.marma_sthanas:
+        for ms, x_um, y_um in zip(
+                self.marma_sthanas, self.ms_x_um.tolist(), self.ms_y_um.tolist()):
             gds_data['marma_sthanas'].append({
                 'id': ms.id,
-                'x_um': ms.x_mm * 1000,
-                'y_um': ms.y_mm * 1000,
+                'x_um': x_um,
+                'y_um': y_um,
                 'connected_layers': ms.connected_layers,
                 'routing_priority': ms.routing_priority
             })
         
-        # Export channels
-        for ch in self.radial_channels:
-            start_x = self.center[0] + ch.start_radius_mm * np.cos(np.radians(ch.angle_deg))
-            start_y = self.center[1] + ch.start_radius_mm * np.sin(np.radians(ch.angle_deg))
-            end_x = self.center[0] + ch.end_radius_mm * np.cos(np.radians(ch.angle_deg))
-            end_y = self.center[1] + ch.end_radius_mm * np.sin(np.radians(ch.angle_deg))
-            
+        # Export channels (all endpoints projected in one vectorized block)
+        cx_um, cy_um = self.center_um
+        starts_x = (cx_um + self.ch_start_r_um * self._ch_cos).tolist()
+        starts_y = (cy_um + self.ch_start_r_um * self._ch_sin).tolist()
+        ends_x = (cx_um + self.ch_end_r_um * self._ch_cos).tolist()
+        ends_y = (cy_um + self.ch_end_r_um * self._ch_sin).tolist()
+        widths_um = self.ch_width_um.tolist()
+        
+        for ch, start_x, start_y, end_x, end_y, width_um in zip(
+                self.radial_channels, starts_x, starts_y, ends_x, ends_y, widths_um):
             gds_data['channels'].append({
                 'type': ch.channel_type,
                 'angle_deg': ch.angle_deg,
-                'start_um': (start_x * 1000, start_y * 1000),
-                'end_um': (end_x * 1000, end_y * 1000),
-                'width_um': ch.width_mm * 1000
+                'start_um': (start_x, start_y),
+                'end_um': (end_x, end_y),
+                'width_um': width_um
             })
         
         # Verify golden ratio relationships
-        radii = [l.outer_radius_mm for l in self.layers[:-1]]  # Exclude boundary
-        for i in range(len(radii) - 1):
-            ratio = radii[i+1] / radii[i] if radii[i] > 0 else 0
-            gds_data['golden_ratio_verification']['layer_ratios'][
-                f'{self.layers[i].name}_to_{self.layers[i+1].name}'
-            ] = round(ratio, 4)
-        
-        return gds_data
+        radii = self.layer_outer_mm[:-1]  # Exclude boundary
+        inner, outer = radii[:-1], radii[1:]
+        ratios = np.where(inner > 0, outer / np.where(inner > 0, inner, 1), 0)
+        names = [f'{self.layers[i].name}_to_{self.layers[i+1].name}'
+                 for i in range(len(radii) - 1)]
+        gds_data['golden_ratio_verification']['layer_ratios'] = dict(
+            zip(names, np.round(ratios, 4).tolist()))
+        
+        return _freeze(gds_data)
     
     def generate_def_file(self) -> str:
         """Generate DEF (Design Exchange Format) compatible output."""
+        return self.def_content
+    
+    @cached_property
+    def def_content(self) -> str:
+        """DEF (Design Exchange Format) text, computed once per layout."""
         
-        def_content = f"""# YANTRA CHIP FLOORPLAN - DEF FORMAT
+        parts = [f"""# YANTRA CHIP FLOORPLAN - DEF FORMAT
 # Generated by SIVAA Project Yantra Layout Generator
 # Die Size: {self.die_size}mm x {self.die_size}mm
 # Process: {self.process_node}nm
@@ -342,31 +396,29 @@ UNITS DISTANCE MICRONS 1000 ;
 DIEAREA ( 0 0 ) ( {int(self.die_size * 1000000)} {int(self.die_size * 1000000)} ) ;
 
 # LAYER DEFINITIONS (Concentric Rings)
-"""
+"""]
         
-        for layer in self.layers:
-            def_content += f"""
+        parts.extend(f"""
 # {layer.name.upper()} - {layer.function}
 # Inner Radius: {layer.inner_radius_mm:.3f}mm, Outer Radius: {layer.outer_radius_mm:.3f}mm
 # Metal Layer: M{layer.metal_layer}, Power Budget: {layer.power_budget_w}W
-"""
+""" for layer in self.layers)
         
-        def_content += f"""
+        parts.append("""
 # MARMA STHANA ROUTING NODES (18 Critical Intersections)
-"""
+""")
         
-        for ms in self.marma_sthanas:
-            def_content += f"""
+        parts.extend(f"""
 COMPONENT marma_{ms.id:02d} PLACED ( {int(ms.x_mm * 1000000)} {int(ms.y_mm * 1000000)} ) N ;
   # Connected to: {', '.join(ms.connected_layers)}
   # Priority: {ms.routing_priority}
-"""
+""" for ms in self.marma_sthanas)
         
-        def_content += """
+        parts.append("""
 END DESIGN
-"""
+""")
         
-        return def_content
+        return "".join(parts)
     
     def print_summary(self):
         """Print human-readable layout summary."""
@@ -433,16 +485,20 @@ def main():
     # Print summary
     layout.print_summary()
     
-    # Export GDS coordinates
-    gds_data = layout.export_gds_coordinates()
+    # Export GDS coordinates (cached, read-only)
+    gds_data = layout.gds_coordinates
     
     # Save to JSON
-    with open('yantra_chip_coordinates.json', 'w') as f:
-        json.dump(gds_data, f, indent=2)
+    if HAS_ORJSON:
+        with open('yantra_chip_coordinates.json', 'wb') as f:
+            f.write(orjson.dumps(gds_data, default=dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open('yantra_chip_coordinates.json', 'w') as f:
+            json.dump(gds_data, f, indent=2, default=dict)
     print(f"\nGDS coordinates saved to: yantra_chip_coordinates.json")
     
     # Generate DEF file
-    def_content = layout.generate_def_file()
+    def_content = layout.def_content
     with open('yantra_chip.def', 'w') as f:
         f.write(def_content)
     print(f"DEF file saved to: yantra_chip.def")
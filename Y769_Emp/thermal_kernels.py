@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+THERMAL STENCIL KERNELS (Pythran AOT backend)
+==============================================
+Ahead-of-time compiled Jacobi sweep for Emp_2_Advanced_Thermal_Sim.py.
+
+Compile once with Pythran to get an auto-vectorized native extension
+(no JIT warm-up per run):
+
+    pythran thermal_kernels.py -O3 -march=native -DUSE_XSIMD
+
+The compiled extension takes precedence over this file on import. Without
+it, this module still works as plain NumPy, so importing it never fails.
+
+Author: SIVAA Research
+"""
+
+#pythran export jacobi_sweep(float32[:,:], float32[:,:], float32[:,:])
+def jacobi_sweep(T_old, T_new, source_term):
+    """One Jacobi sweep of the 5-point stencil over the grid interior."""
+    T_new[1:-1, 1:-1] = 0.25 * (
+        T_old[2:, 1:-1] + T_old[:-2, 1:-1] +
+        T_old[1:-1, 2:] + T_old[1:-1, :-2] +
+        source_term[1:-1, 1:-1]
+    )
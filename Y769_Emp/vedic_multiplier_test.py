@@ -6,6 +6,20 @@ Tests the Urdhva Tiryagbhyam (vertically and crosswise) algorithm
 for 8x8 bit multiplication as used in SIVAA architecture.
 """
 
+import time
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Compile the multipliers to native code (inlined into one another, so the
+# recursion folds away) when Numba is available; plain Python otherwise
+jit = njit(cache=True, inline='always') if HAS_NUMBA else (lambda f: f)
+
+@jit
 def vedic_2x2(a, b):
     """2-bit Vedic multiplier"""
     pp0 = (a & 1) * (b & 1)
@@ -14,6 +28,7 @@ def vedic_2x2(a, b):
     pp3 = ((a >> 1) & 1) * ((b >> 1) & 1)
     return pp0 + ((pp1 + pp2) << 1) + (pp3 << 2)
 
+@jit
 def vedic_4x4(a, b):
     """4-bit Vedic multiplier using 2x2 blocks"""
     q0 = vedic_2x2(a & 0x3, b & 0x3)
@@ -22,6 +37,7 @@ def vedic_4x4(a, b):
     q3 = vedic_2x2((a >> 2) & 0x3, (b >> 2) & 0x3)
     return q0 + (q1 << 2) + (q2 << 2) + (q3 << 4)
 
+@jit
 def vedic_8x8(a, b):
     """8-bit Vedic multiplier using 4x4 blocks"""
     q0 = vedic_4x4(a & 0xF, b & 0xF)
@@ -30,6 +46,24 @@ def vedic_8x8(a, b):
     q3 = vedic_4x4((a >> 4) & 0xF, (b >> 4) & 0xF)
     return q0 + (q1 << 4) + (q2 << 4) + (q3 << 8)
 
+if HAS_NUMBA:
+    @vectorize(['uint16(uint8, uint8)'], cache=True)
+    def vedic_8x8_batch(a, b):
+        """8-bit Vedic multiplier over broadcast uint8 operand arrays"""
+        return vedic_8x8(a, b)
+else:
+    def vedic_8x8_batch(a, b):
+        """8-bit Vedic multiplier over broadcast uint8 operand arrays"""
+        # The bit operations are elementwise, so NumPy arrays go straight
+        # through; uint16 holds every product up to 255 * 255
+        return vedic_8x8(np.asarray(a, dtype=np.uint16),
+                         np.asarray(b, dtype=np.uint16))
+
+def vedic_8x8_batch_reference(a, b):
+    """All products of two uint8 operand vectors in one NumPy call"""
+    return np.multiply.outer(np.asarray(a, dtype=np.uint16),
+                             np.asarray(b, dtype=np.uint16))
+
 def run_tests():
     """Run comprehensive test suite"""
     tests = [
@@ -48,7 +82,21 @@ def run_tests():
             print(f"  FAIL: {a} x {b} = {result} (expected {expected})")
     
     print(f"\nResult: {passed}/{len(tests)} tests passed")
-    return passed == len(tests)
+    
+    # Exhaustive check of all 65,536 operand pairs: the algorithmic model in
+    # one batched call against a plain multiply
+    operands = np.arange(256, dtype=np.uint8)
+    start = time.perf_counter()
+    products = vedic_8x8_batch(operands[:, None], operands[None, :])
+    vedic_time = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = vedic_8x8_batch_reference(operands, operands)
+    reference_time = time.perf_counter() - start
+    correct = products.size - np.count_nonzero(products != expected)
+    print(f"Exhaustive: {correct}/{products.size} operand pairs correct "
+          f"(Vedic {vedic_time*1e3:.2f} ms, multiply {reference_time*1e3:.2f} ms)")
+    
+    return passed == len(tests) and correct == products.size
 
 if __name__ == "__main__":
     print("="*60)
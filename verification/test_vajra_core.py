@@ -17,10 +17,16 @@ Date: December 2025
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer, FallingEdge
+from cocotb.triggers import RisingEdge, Timer, FallingEdge, First, ClockCycles
 from cocotb.result import TestFailure
 import random
 
+# Clock period for every test (1 GHz for neuromorphic speed)
+CLOCK_PERIOD_NS = 1
+
+# Seed for the stress-test pattern sequence
+STRESS_SEED = 0xA5
+
 # =============================================================================
 # TEST 1: Fractal Propagation Test
 # =============================================================================
@@ -32,7 +38,7 @@ async def test_fractal_propagation(dut):
     dut._log.info("=== VAJRA TEST: Fractal Propagation ===")
     
     # 1. Initialize Clock (1 GHz for neuromorphic speed)
-    clock = Clock(dut.clk, 1, units="ns")
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # 2. Reset the Core
@@ -50,18 +56,17 @@ async def test_fractal_propagation(dut):
     dut.bindu_valid.value = 0
     
     # 4. Wait for propagation through fractal network
-    for _ in range(100):
-        await RisingEdge(dut.clk)
-        if dut.propagation_complete.value == 1:
-            break
+    if not await wait_for_propagation(dut, 100):
+        raise TestFailure("Propagation did not complete within 100 cycles")
     
     # 5. Verify all 8 Shakti gates received the signal
-    for i in range(8):
-        actual_val = int(dut.shakti_out[i].value)
-        valid = int(dut.shakti_valid.value) & (1 << i)
-        
-        dut._log.info(f"Shakti[{i}]: value={hex(actual_val)}, valid={valid>0}")
-        
+    shakti_values = [int(dut.shakti_out[i].value) for i in range(8)]
+    shakti_valid = int(dut.shakti_valid.value)
+    dut._log.info("Shakti: " + " ".join(f"[{i}]={hex(v)}" for i, v in enumerate(shakti_values))
+                  + f", valid={shakti_valid:08b}")
+    
+    for i, actual_val in enumerate(shakti_values):
+        valid = shakti_valid & (1 << i)
         if valid and actual_val != test_pattern:
             raise TestFailure(f"Signal Distortion at Shakti[{i}]! Expected: {hex(test_pattern)}, Got: {hex(actual_val)}")
     
@@ -85,7 +90,7 @@ async def test_multiple_patterns(dut):
     
     dut._log.info("=== VAJRA TEST: Multiple Patterns ===")
     
-    clock = Clock(dut.clk, 1, units="ns")
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # Reset
@@ -105,13 +110,11 @@ async def test_multiple_patterns(dut):
         dut.bindu_valid.value = 0
         
         # Wait for propagation
-        for _ in range(100):
-            await RisingEdge(dut.clk)
-            if dut.propagation_complete.value == 1:
-                break
-        
-        dut._log.info(f"Pattern {hex(pattern)}: Propagation complete")
+        if not await wait_for_propagation(dut, 100):
+            raise TestFailure(f"Pattern {hex(pattern)}: propagation did not complete within 100 cycles")
     
+    dut._log.info(f"Propagation complete for {len(patterns)} patterns: "
+                  + " ".join(hex(p) for p in patterns))
     dut._log.info("VAJRA TEST PASSED: All patterns propagated correctly!")
 
 
@@ -125,7 +128,7 @@ async def test_latency(dut):
     
     dut._log.info("=== VAJRA TEST: Latency Measurement ===")
     
-    clock = Clock(dut.clk, 1, units="ns")
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # Reset
@@ -144,18 +147,17 @@ async def test_latency(dut):
     start_time = cocotb.utils.get_sim_time(units="ns")
     
     # Wait for completion
-    cycles = 0
-    for _ in range(200):
-        await RisingEdge(dut.clk)
-        cycles += 1
-        if dut.propagation_complete.value == 1:
-            break
+    if not await wait_for_propagation(dut, 200):
+        raise TestFailure("Propagation did not complete within 200 cycles")
     
     end_time = cocotb.utils.get_sim_time(units="ns")
     
     latency_ns = end_time - start_time
+    # Clock cycles up to the edge on which propagation_complete rises (the
+    # old polling loop sampled it one edge later and counted one cycle more)
+    cycles = round(latency_ns / CLOCK_PERIOD_NS)
     
-    dut._log.info(f"Propagation completed in {cycles} cycles ({latency_ns} ns)")
+    dut._log.info(f"Propagation completed in {cycles} cycles to the completion edge ({latency_ns} ns)")
     dut._log.info(f"Efficiency Score: {int(dut.efficiency_score.value)}%")
     
     # Fractal routing should complete within 70 cycles (40% faster than Manhattan)
@@ -175,7 +177,12 @@ async def test_stress(dut):
     
     dut._log.info("=== VAJRA TEST: Stress Test ===")
     
-    clock = Clock(dut.clk, 1, units="ns")
+    # 100 random patterns, drawn up front from a fixed seed so a failing
+    # pattern can be reproduced
+    rng = random.Random(STRESS_SEED)
+    patterns = [rng.randrange(256) for _ in range(100)]
+    
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # Reset
@@ -185,22 +192,17 @@ async def test_stress(dut):
     dut.reset.value = 0
     await RisingEdge(dut.clk)
     
-    # 100 random patterns
-    for i in range(100):
-        pattern = random.randint(0, 255)
-        
+    for i, pattern in enumerate(patterns):
         dut.bindu_input.value = pattern
         dut.bindu_valid.value = 1
         await RisingEdge(dut.clk)
         dut.bindu_valid.value = 0
         
         # Wait for completion
-        for _ in range(100):
-            await RisingEdge(dut.clk)
-            if dut.propagation_complete.value == 1:
-                break
+        if not await wait_for_propagation(dut, 100):
+            raise TestFailure(f"Pattern {i} ({hex(pattern)}): propagation did not complete within 100 cycles")
     
-    dut._log.info(f"Stress test: 100 random patterns completed")
+    dut._log.info(f"Stress test: {len(patterns)} random patterns completed")
     dut._log.info("VAJRA TEST PASSED: Stress test successful!")
 
 
@@ -208,6 +210,14 @@ async def test_stress(dut):
 # HELPER FUNCTIONS
 # =============================================================================
 
+async def wait_for_propagation(dut, max_cycles):
+    """Wait for propagation_complete to rise; False if max_cycles pass first"""
+    # Wakes once on the completion edge instead of polling every clock cycle
+    timeout = ClockCycles(dut.clk, max_cycles)
+    fired = await First(RisingEdge(dut.propagation_complete), timeout)
+    return fired is not timeout
+
+
 def get_efficiency_report(dut):
     """Generate efficiency report"""
     return {